@@ -0,0 +1,68 @@
+"""
+Shared fixtures for the High School Management System API tests
+"""
+
+from types import MappingProxyType
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import app, activities
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a test client shared across the whole test session"""
+    # Redirects must be followed explicitly per request
+    with TestClient(app, follow_redirects=False) as test_client:
+        yield test_client
+
+
+# Baseline activities, restored for tests that request reset_activities or
+# activities_response. The view is read-only and only participants ever
+# change, so the other values can be shared between resets.
+_BASELINE_ACTIVITIES = MappingProxyType({
+    "Chess Club": MappingProxyType({
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": ("michael@mergington.edu", "daniel@mergington.edu")
+    }),
+    "Soccer Team": MappingProxyType({
+        "description": "Join our varsity soccer team and compete in regional tournaments",
+        "schedule": "Mondays, Wednesdays, Fridays, 4:00 PM - 6:00 PM",
+        "max_participants": 25,
+        "participants": ("alex@mergington.edu", "sarah@mergington.edu")
+    }),
+    "Programming Class": MappingProxyType({
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": ()
+    })
+})
+
+
+def _restore_activities():
+    """Replace the in-memory activities with a fresh copy of the baseline"""
+    activities.clear()
+    activities.update({
+        name: {**details, "participants": list(details["participants"])}
+        for name, details in _BASELINE_ACTIVITIES.items()
+    })
+
+
+@pytest.fixture
+def reset_activities():
+    """Reset activities data for tests that read or mutate it"""
+    _restore_activities()
+
+
+@pytest.fixture(scope="module")
+def activities_response(client):
+    """Fetch the baseline GET /activities payload once per module"""
+    # Read-only tests do not request reset_activities, so start from the baseline
+    _restore_activities()
+    response = client.get("/activities")
+    assert response.status_code == 200
+    return response.json()
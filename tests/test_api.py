@@ -3,67 +3,56 @@ Tests for the High School Management System API
 """
 
 import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
+from fastapi import HTTPException
 
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from app import activities, remove_participant, signup_for_activity
 
-from app import app, activities
+
+NEW_STUDENTS = [
+    "student1@mergington.edu",
+    "student2@mergington.edu",
+    "student3@mergington.edu"
+]
+
+MULTITASK_EMAIL = "multitask@mergington.edu"
+MULTITASK_ACTIVITIES = ["Chess Club", "Soccer Team", "Programming Class"]
 
 
 @pytest.fixture
-def client():
-    """Create a test client"""
-    return TestClient(app)
-
-
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities data before each test"""
-    activities.clear()
-    activities.update({
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Soccer Team": {
-            "description": "Join our varsity soccer team and compete in regional tournaments",
-            "schedule": "Mondays, Wednesdays, Fridays, 4:00 PM - 6:00 PM",
-            "max_participants": 25,
-            "participants": ["alex@mergington.edu", "sarah@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": []
-        }
-    })
+def signed_up_students(client, reset_activities):
+    """Sign up all new students for Programming Class"""
+    for email in NEW_STUDENTS:
+        response = client.post("/activities/Programming Class/signup", params={"email": email})
+        assert response.status_code == 200
+    return NEW_STUDENTS
+
+
+@pytest.fixture
+def multitask_student(request, client, reset_activities):
+    """Sign up one student for the activities given by indirect parametrization"""
+    for activity in request.param:
+        response = client.post(f"/activities/{activity}/signup", params={"email": MULTITASK_EMAIL})
+        assert response.status_code == 200
+    return MULTITASK_EMAIL
 
 
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
 
-    def test_get_activities_success(self, client):
+    def test_get_activities_success(self, activities_response):
         """Test getting all activities"""
-        response = client.get("/activities")
-        assert response.status_code == 200
-        data = response.json()
+        data = activities_response
         assert "Chess Club" in data
         assert "Soccer Team" in data
         assert "Programming Class" in data
-        assert len(data["Chess Club"]["participants"]) == 2
+        assert data["Chess Club"]["participants"] == [
+            "michael@mergington.edu",
+            "daniel@mergington.edu"
+        ]
 
-    def test_activities_structure(self, client):
+    def test_activities_structure(self, activities_response):
         """Test that activities have the correct structure"""
-        response = client.get("/activities")
-        data = response.json()
-        
-        chess_club = data["Chess Club"]
+        chess_club = activities_response["Chess Club"]
         assert "description" in chess_club
         assert "schedule" in chess_club
         assert "max_participants" in chess_club
@@ -74,10 +63,11 @@ class TestGetActivities:
 class TestSignupForActivity:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
 
-    def test_signup_success(self, client):
+    def test_signup_success(self, client, reset_activities):
         """Test successful signup for an activity"""
         response = client.post(
-            "/activities/Programming Class/signup?email=newstudent@mergington.edu"
+            "/activities/Programming Class/signup",
+            params={"email": "newstudent@mergington.edu"}
         )
         assert response.status_code == 200
         data = response.json()
@@ -86,64 +76,46 @@ class TestSignupForActivity:
         assert "Programming Class" in data["message"]
 
         # Verify the participant was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "newstudent@mergington.edu" in activities_data["Programming Class"]["participants"]
+        assert "newstudent@mergington.edu" in activities["Programming Class"]["participants"]
 
-    def test_signup_activity_not_found(self, client):
-        """Test signup for non-existent activity"""
-        response = client.post(
-            "/activities/Non Existent Activity/signup?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "Activity not found" in data["detail"]
-
-    def test_signup_already_registered(self, client):
+    def test_signup_already_registered(self, reset_activities):
         """Test signup when student is already registered"""
-        # First signup
-        client.post("/activities/Programming Class/signup?email=duplicate@mergington.edu")
-        
+        # No routing involved, so call the handler directly
+        signup_for_activity("Programming Class", "duplicate@mergington.edu")
+
         # Try to signup again
-        response = client.post(
-            "/activities/Programming Class/signup?email=duplicate@mergington.edu"
-        )
-        assert response.status_code == 400
-        data = response.json()
-        assert "already signed up" in data["detail"]
+        with pytest.raises(HTTPException) as exc_info:
+            signup_for_activity("Programming Class", "duplicate@mergington.edu")
+        assert exc_info.value.status_code == 400
+        assert "already signed up" in exc_info.value.detail
 
-    def test_signup_with_special_characters_in_name(self, client):
+    def test_signup_with_special_characters_in_name(self, client, reset_activities):
         """Test signup with URL encoded activity name"""
         # Activity name with spaces should work
         response = client.post(
-            "/activities/Chess%20Club/signup?email=newchess@mergington.edu"
+            "/activities/Chess%20Club/signup",
+            params={"email": "newchess@mergington.edu"}
         )
         assert response.status_code == 200
 
-    def test_signup_multiple_students(self, client):
+    @pytest.mark.parametrize("email", NEW_STUDENTS)
+    def test_signup_multiple_students(self, client, reset_activities, email):
+        """Test each new student can sign up for the same activity"""
+        response = client.post("/activities/Programming Class/signup", params={"email": email})
+        assert response.status_code == 200
+        assert email in activities["Programming Class"]["participants"]
+
+    def test_signup_multiple_students_all_added(self, signed_up_students):
         """Test multiple students signing up for the same activity"""
-        emails = [
-            "student1@mergington.edu",
-            "student2@mergington.edu",
-            "student3@mergington.edu"
-        ]
-        
-        for email in emails:
-            response = client.post(f"/activities/Programming Class/signup?email={email}")
-            assert response.status_code == 200
-
-        # Verify all were added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        participants = activities_data["Programming Class"]["participants"]
-        for email in emails:
+        participants = set(activities["Programming Class"]["participants"])
+        for email in signed_up_students:
             assert email in participants
 
 
 class TestRemoveParticipant:
     """Tests for DELETE /activities/{activity_name}/participants/{email} endpoint"""
 
-    def test_remove_participant_success(self, client):
+    def test_remove_participant_success(self, client, reset_activities):
         """Test successful removal of a participant"""
         response = client.delete(
             "/activities/Chess Club/participants/michael@mergington.edu"
@@ -154,39 +126,47 @@ class TestRemoveParticipant:
         assert "michael@mergington.edu" in data["message"]
 
         # Verify the participant was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "michael@mergington.edu" not in activities_data["Chess Club"]["participants"]
-        assert "daniel@mergington.edu" in activities_data["Chess Club"]["participants"]
-
-    def test_remove_participant_activity_not_found(self, client):
-        """Test removing participant from non-existent activity"""
-        response = client.delete(
-            "/activities/Non Existent/participants/test@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "Activity not found" in data["detail"]
-
-    def test_remove_participant_not_registered(self, client):
-        """Test removing participant that is not registered"""
-        response = client.delete(
-            "/activities/Chess Club/participants/notregistered@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "Participant not found" in data["detail"]
+        assert activities["Chess Club"]["participants"] == ["daniel@mergington.edu"]
 
-    def test_remove_all_participants(self, client):
+    def test_remove_all_participants(self, client, reset_activities):
         """Test removing all participants from an activity"""
         # Remove both participants
         client.delete("/activities/Chess Club/participants/michael@mergington.edu")
         client.delete("/activities/Chess Club/participants/daniel@mergington.edu")
 
         # Verify all removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert len(activities_data["Chess Club"]["participants"]) == 0
+        assert activities["Chess Club"]["participants"] == []
+
+    def test_remove_participant_not_registered(self, reset_activities):
+        """Test removing participant that is not registered"""
+        with pytest.raises(HTTPException) as exc_info:
+            remove_participant("Chess Club", "notregistered@mergington.edu")
+        assert exc_info.value.status_code == 404
+        assert "Participant not found" in exc_info.value.detail
+
+
+class TestNotFound:
+    """Tests for 404 responses for unknown activities"""
+
+    @pytest.mark.parametrize(
+        "method, url, params, expected_detail",
+        [
+            ("post", "/activities/Non Existent Activity/signup",
+             {"email": "test@mergington.edu"}, "Activity not found"),
+            ("delete", "/activities/Non Existent/participants/test@mergington.edu",
+             None, "Activity not found"),
+        ],
+        ids=[
+            "signup_activity_not_found",
+            "remove_participant_activity_not_found"
+        ]
+    )
+    def test_not_found(self, client, reset_activities, method, url, params, expected_detail):
+        """Test requests for activities that do not exist"""
+        response = getattr(client, method)(url, params=params)
+        assert response.status_code == 404
+        data = response.json()
+        assert expected_detail in data["detail"]
 
 
 class TestRootEndpoint:
@@ -194,7 +174,7 @@ class TestRootEndpoint:
 
     def test_root_redirects(self, client):
         """Test that root redirects to static/index.html"""
-        response = client.get("/", follow_redirects=False)
+        response = client.get("/")
         assert response.status_code == 307  # Temporary redirect
         assert "/static/index.html" in response.headers["location"]
 
@@ -202,38 +182,39 @@ class TestRootEndpoint:
 class TestIntegration:
     """Integration tests combining multiple operations"""
 
-    def test_signup_and_remove_workflow(self, client):
+    def test_signup_and_remove_workflow(self, client, reset_activities):
         """Test complete workflow: signup and then remove"""
         email = "workflow@mergington.edu"
         activity = "Programming Class"
 
         # Signup
-        signup_response = client.post(f"/activities/{activity}/signup?email={email}")
+        signup_response = client.post(f"/activities/{activity}/signup", params={"email": email})
         assert signup_response.status_code == 200
 
         # Verify signup
-        activities_response = client.get("/activities")
-        assert email in activities_response.json()[activity]["participants"]
+        assert email in activities[activity]["participants"]
 
         # Remove
         remove_response = client.delete(f"/activities/{activity}/participants/{email}")
         assert remove_response.status_code == 200
 
         # Verify removal
-        activities_response = client.get("/activities")
-        assert email not in activities_response.json()[activity]["participants"]
-
-    def test_multiple_activities_per_student(self, client):
-        """Test that a student can sign up for multiple activities"""
-        email = "multitask@mergington.edu"
-        activities_to_join = ["Chess Club", "Soccer Team", "Programming Class"]
-
-        for activity in activities_to_join:
-            response = client.post(f"/activities/{activity}/signup?email={email}")
-            assert response.status_code == 200
-
-        # Verify student is in all activities
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        for activity in activities_to_join:
-            assert email in activities_data[activity]["participants"]
+        assert email not in activities[activity]["participants"]
+
+    @pytest.mark.parametrize(
+        "multitask_student, activity",
+        [
+            ([other for other in MULTITASK_ACTIVITIES if other != activity], activity)
+            for activity in MULTITASK_ACTIVITIES
+        ],
+        ids=MULTITASK_ACTIVITIES,
+        indirect=["multitask_student"]
+    )
+    def test_multiple_activities_per_student(self, client, multitask_student, activity):
+        """Test that a student in the other activities can also join this one"""
+        response = client.post(f"/activities/{activity}/signup", params={"email": multitask_student})
+        assert response.status_code == 200
+
+        # Joining this activity must not drop the student from the others
+        for joined in MULTITASK_ACTIVITIES:
+            assert multitask_student in activities[joined]["participants"]